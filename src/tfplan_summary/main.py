@@ -1,12 +1,65 @@
 #!/usr/bin/env python3
 
 import argparse
+import contextlib
+import functools
+import hashlib
 import json
+import os
 import sys
-from typing import Any, cast
-
-from rich.console import Console
-from rich.table import Table
+import time
+from collections import Counter, defaultdict
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+# rich is slow to import, so it is only imported where tables are built and printed
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# orjson is an optional speedup, fall back to the stdlib parser when it isn't installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# ijson streams `resource_changes` without loading the rest of the plan, it picks the C backend when available
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+# Read plans in 1 MiB chunks when streaming, large plans otherwise cost thousands of small read() calls
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Error messages shared by the file loaders
+READ_ERROR = "ERROR: Could not read file: {file_path}"
+INVALID_JSON_ERROR = "ERROR: Invalid JSON format in file '{file_path}'"
+
+# Bump when the summary format changes so stale cache entries are ignored
+CACHE_VERSION = 1
+
+# Cache entries older than this are removed whenever a new entry is written
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# Bit flags for the Terraform actions that decide a resource's effective action
+ACTION_BITS = {"create": 1, "delete": 2, "update": 4, "no-op": 8}
+
+# Effective action for every combination of ACTION_BITS, indexed by mask. None means no known action was found.
+# fmt: off
+ACTION_TABLE: tuple[str | None, ...] = (
+    None, "create", "delete", "replace",      # -, create, delete, create+delete
+    "update", "create", "delete", "replace",  # update + the above
+    "no-op", "create", "delete", "replace",   # no-op + the above
+    "update", "create", "delete", "replace",  # no-op + update + the above
+)
+# fmt: on
+
+# Display order for the effective actions, anything else (e.g. "read") is listed after these alphabetically
+ACTION_ORDER = ("create", "delete", "no-op", "replace", "unknown", "update")
+
+# Shared stand-in for resources without change data, avoids allocating a new dict per resource
+_EMPTY_CHANGE: dict[str, Any] = {}
 
 # https://rich.readthedocs.io/en/stable/appendix/colors.html
 COLOR_MAP = {
@@ -44,9 +97,23 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Display only the resource changes table (if neither -s nor -r is specified, both are shown)",
     )
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the summary cache")
     return parser.parse_args()
 
 
+def check_json_extension(file_path: str) -> None:
+    """Checks that a file has a `.json` extension.
+
+    Args:
+        file_path: The path to the file to check.
+
+    Raises:
+        SystemExit: If the file is not a JSON file.
+    """
+    if not file_path.lower().endswith(".json"):
+        sys.exit(f"ERROR: File '{file_path}' is not a JSON file")
+
+
 def validate_file(file_path: str) -> dict[str, Any]:
     """Validates and loads the content of a JSON file.
 
@@ -59,18 +126,50 @@ def validate_file(file_path: str) -> dict[str, Any]:
     Raises:
         SystemExit: If the file is invalid or cannot be read.
     """
-    if not file_path.lower().endswith(".json"):
-        sys.exit(f"ERROR: File '{file_path}' is not a JSON file")
+    check_json_extension(file_path)
 
     try:
-        with open(file_path) as file:
-            # FIX: Use `cast` to satisfy mypy's strict checking for `json.load()`
-            json_data = cast(dict[str, Any], json.load(file))
+        # Read the whole file in one go so the parser works on a single contiguous buffer
+        with open(file_path, "rb") as file:
+            data = file.read()
+        # FIX: Use `cast` to satisfy mypy's strict checking for the untyped parser output
+        json_data = cast(dict[str, Any], orjson.loads(data) if orjson else json.loads(data))
         return json_data
     except OSError:
-        sys.exit(f"ERROR: Could not read file: {file_path}")
-    except json.JSONDecodeError:
-        sys.exit(f"ERROR: Invalid JSON format in file '{file_path}'")
+        sys.exit(READ_ERROR.format(file_path=file_path))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so both parsers land here
+        sys.exit(INVALID_JSON_ERROR.format(file_path=file_path))
+
+
+def iter_resource_changes(file_path: str) -> Iterator[dict[str, Any]]:
+    """Streams the resource changes from a Terraform plan JSON file.
+
+    Only the `resource_changes` array is materialized, one entry at a time, so the rest
+    of the plan is never held in memory. Falls back to `validate_file` when ijson is not installed.
+
+    Args:
+        file_path: The path to the Terraform plan JSON file.
+
+    Yields:
+        Resource change dictionaries from the plan.
+
+    Raises:
+        SystemExit: If the file is invalid or cannot be read.
+    """
+    if ijson is None:
+        yield from cast(list[dict[str, Any]], validate_file(file_path).get("resource_changes", []))
+        return
+
+    check_json_extension(file_path)
+
+    try:
+        with open(file_path, "rb", buffering=READ_BUFFER_SIZE) as file:
+            yield from ijson.items(file, "resource_changes.item", buf_size=READ_BUFFER_SIZE)
+    except OSError:
+        sys.exit(READ_ERROR.format(file_path=file_path))
+    except ijson.JSONError:
+        sys.exit(INVALID_JSON_ERROR.format(file_path=file_path))
 
 
 def get_effective_action(actions: list[str]) -> str:
@@ -82,57 +181,250 @@ def get_effective_action(actions: list[str]) -> str:
     Returns:
         The single, representative action string.
     """
-    action_set = set(actions)
-    if "delete" in action_set and "create" in action_set:
-        return "replace"
-    if "create" in action_set:
-        return "create"
-    if "delete" in action_set:
-        return "delete"
-    if "update" in action_set:
-        return "update"
-    if "no-op" in action_set:
-        return "no-op"
+    mask = 0
+    for action in actions:
+        mask |= ACTION_BITS.get(action, 0)
+    effective_action = ACTION_TABLE[mask]
+    if effective_action:
+        return effective_action
+
+    return _name_actions(tuple(actions))
+
+
+@functools.lru_cache(maxsize=64)
+def _name_actions(actions: tuple[str, ...]) -> str:
+    """Names a combination of actions that has no known effective action.
+
+    Plans only contain a handful of distinct action combinations, so the result is memoized.
+
+    Args:
+        actions: A tuple of action strings from a Terraform plan.
 
+    Returns:
+        The sorted, comma-joined actions, or "unknown" if there are none.
+    """
     return ",".join(sorted(actions)) if actions else "unknown"
 
 
-def build_summary(resource_changes: list[dict[str, Any]]) -> dict[str, list[str]]:
+def iter_effective_actions(
+    resource_changes: Iterable[dict[str, Any]],
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Classifies each resource change by its effective action.
+
+    This is the single classification loop shared by `build_summary` and `summarize_counts`. It runs once
+    per resource, so `get_effective_action` is inlined and lookups are bound up front.
+
+    Args:
+        resource_changes: An iterable of resource change dictionaries from the plan.
+
+    Yields:
+        Tuples of the effective action and the resource change it was derived from.
+    """
+    action_bits_get = ACTION_BITS.get
+    action_table = ACTION_TABLE
+    for resource in resource_changes:
+        actions = (resource.get("change") or _EMPTY_CHANGE).get("actions", ())
+        mask = 0
+        for action in actions:
+            mask |= action_bits_get(action, 0)
+        yield action_table[mask] or _name_actions(tuple(actions)), resource
+
+
+def build_summary(
+    resource_changes: Iterable[dict[str, Any]], skip_actions: Collection[str] = ()
+) -> dict[str, list[str]]:
     """Groups resource addresses by their effective action.
 
     Args:
-        resource_changes: A list of resource change dictionaries from the plan.
+        resource_changes: An iterable of resource change dictionaries from the plan.
+        skip_actions: Effective actions whose resources are left out of the summary, e.g. "no-op"
+            when only the changes table is shown.
 
     Returns:
         A dictionary mapping actions to lists of resource addresses.
     """
-    action_address_map: dict[str, list[str]] = {}
-    for resource in resource_changes:
-        change_data = resource.get("change", {})
-        actions = change_data.get("actions", []) if change_data else []
-        address = resource.get("address", "unknown_address")
-        effective_action = get_effective_action(actions)
-        action_address_map.setdefault(effective_action, []).append(address)
-    return action_address_map
+    action_address_map: defaultdict[str, list[str]] = defaultdict(list)
+    skipped = frozenset(skip_actions)
+    for effective_action, resource in iter_effective_actions(resource_changes):
+        if effective_action in skipped:
+            continue
+        action_address_map[effective_action].append(resource.get("address", "unknown_address"))
+    return dict(action_address_map)
+
+
+def summarize_counts(resource_changes: Iterable[dict[str, Any]]) -> Counter[str]:
+    """Counts resources per effective action without keeping their addresses.
+
+    Used when only the statistics table is shown without the cache, so no address strings are retained.
+
+    Args:
+        resource_changes: An iterable of resource change dictionaries from the plan.
+
+    Returns:
+        A Counter mapping actions to the number of resources.
+    """
+    return Counter(effective_action for effective_action, _ in iter_effective_actions(resource_changes))
+
+
+def get_cache_path(file_path: str) -> Path | None:
+    """Returns the cache file for a plan, keyed by its absolute path, modification time and size.
+
+    The cache lives in `$XDG_CACHE_HOME/tfplan-summary`, or `~/.cache/tfplan-summary` if unset.
+
+    Args:
+        file_path: The path to the Terraform plan JSON file.
+
+    Returns:
+        The path of the cache file, or None if the plan file cannot be read or there is no cache directory.
+    """
+    try:
+        stat = os.stat(file_path)
+        # Path.home() raises RuntimeError when HOME is unset and the user has no passwd entry
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    except (OSError, RuntimeError):
+        return None
+    key_source = f"{CACHE_VERSION}:{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    key = hashlib.blake2b(key_source.encode()).hexdigest()[:16]
+    cache_dir = Path(cache_home) / "tfplan-summary"
+    return cache_dir / f"{key}.json"
+
 
+def read_cached_summary(cache_path: Path) -> dict[str, list[str]] | None:
+    """Reads a cached summary, treating any read or decode error as a cache miss.
 
-def build_statistics_table(summary: dict[str, list[str]], color: bool = False) -> Table:
+    Args:
+        cache_path: The cache file returned by `get_cache_path`.
+
+    Returns:
+        The cached summary, or None if there is no usable cache entry.
+    """
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    # A truncated or foreign cache file can hold any JSON, only accept a mapping of actions to address lists
+    if not isinstance(cached, dict) or not all(
+        isinstance(addresses, list) and all(isinstance(address, str) for address in addresses)
+        for addresses in cached.values()
+    ):
+        return None
+    return cast(dict[str, list[str]], cached)
+
+
+def prune_cache(cache_dir: Path) -> None:
+    """Removes cache entries and leftover temporary files older than `CACHE_MAX_AGE_SECONDS`.
+
+    Args:
+        cache_dir: The cache directory, i.e. the parent of the paths returned by `get_cache_path`.
+    """
+    cutoff = time.time() - CACHE_MAX_AGE_SECONDS
+    for entry in cache_dir.glob("*.*"):
+        with contextlib.suppress(OSError):
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+
+
+def load_summary(
+    file_path: str, use_cache: bool = True, skip_actions: Collection[str] = ()
+) -> dict[str, list[str]]:
+    """Builds the action summary for a plan file, reusing a cached summary if the file is unchanged.
+
+    Cache errors are never fatal, a broken or unwritable cache just means the plan is parsed again.
+
+    Args:
+        file_path: The path to the Terraform plan JSON file.
+        use_cache: If False, the cache is neither read nor written.
+        skip_actions: Effective actions that may be left out of the summary, see `build_summary`. Only
+            applied when the cache is off, with the cache enabled the full summary is built and stored.
+
+    Returns:
+        A dictionary mapping actions to lists of resource addresses.
+
+    Raises:
+        SystemExit: If the file is invalid or cannot be read.
+    """
+    cache_path = get_cache_path(file_path) if use_cache else None
+    if not cache_path:
+        return build_summary(iter_resource_changes(file_path), skip_actions=skip_actions)
+
+    cached_summary = read_cached_summary(cache_path)
+    if cached_summary is not None:
+        return cached_summary
+
+    summary = build_summary(iter_resource_changes(file_path))
+
+    # Write to a temporary file first so concurrent runs never see a partial cache entry
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(summary))
+        os.replace(tmp_path, cache_path)
+        prune_cache(cache_path.parent)
+    except OSError:
+        # Don't leave a partial temporary file behind when the write fails
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+    return summary
+
+
+def load_counts(file_path: str, use_cache: bool = True) -> Counter[str]:
+    """Counts resources per action for a plan file, reusing a cached summary if the file is unchanged.
+
+    With the cache enabled, a cache miss builds and stores the full summary so later runs can reuse it.
+    Without it, the resources are only counted and no addresses are kept.
+
+    Args:
+        file_path: The path to the Terraform plan JSON file.
+        use_cache: If False, the cache is neither read nor written.
+
+    Returns:
+        A Counter mapping actions to the number of resources.
+
+    Raises:
+        SystemExit: If the file is invalid or cannot be read.
+    """
+    if not use_cache or get_cache_path(file_path) is None:
+        return summarize_counts(iter_resource_changes(file_path))
+    summary = load_summary(file_path)
+    return Counter({action: len(addresses) for action, addresses in summary.items()})
+
+
+def order_actions(actions: Iterable[str]) -> list[str]:
+    """Orders actions for display without sorting the known action names at runtime.
+
+    Args:
+        actions: The actions to order, e.g. the keys of a summary.
+
+    Returns:
+        The known actions in `ACTION_ORDER`, followed by any other actions sorted alphabetically.
+    """
+    present = set(actions)
+    ordered = [action for action in ACTION_ORDER if action in present]
+    if len(ordered) < len(present):
+        ordered.extend(sorted(present.difference(ACTION_ORDER)))
+    return ordered
+
+
+def build_statistics_table(summary: Mapping[str, list[str]] | Mapping[str, int], color: bool = False) -> "Table":
     """Creates a rich Table summarizing the count of resources per action.
 
     Args:
-        summary: The dictionary mapping actions to resource addresses.
+        summary: The dictionary mapping actions to resource addresses, or to resource counts.
         color: If True, applies colors to the table output.
 
     Returns:
         A rich Table object ready for printing.
     """
+    from rich.table import Table
+
     stats_table = Table(title="Action Statistics")
     stats_table.add_column("Action", style="white", no_wrap=True)
     stats_table.add_column("Count", style="white", justify="right")
 
     total_resources = 0
-    for action in sorted(summary.keys()):
-        count = len(summary[action])
+    for action in order_actions(summary):
+        addresses_or_count = summary[action]
+        count = addresses_or_count if isinstance(addresses_or_count, int) else len(addresses_or_count)
         if count == 0:
             continue
         total_resources += count
@@ -153,7 +445,7 @@ def build_statistics_table(summary: dict[str, list[str]], color: bool = False) -
     return stats_table
 
 
-def build_changes_table(summary: dict[str, list[str]], color: bool = False) -> Table:
+def build_changes_table(summary: dict[str, list[str]], color: bool = False) -> "Table":
     """Creates a rich Table listing the resource addresses for each action.
 
     Args:
@@ -163,53 +455,61 @@ def build_changes_table(summary: dict[str, list[str]], color: bool = False) -> T
     Returns:
         A rich Table object ready for printing.
     """
+    from rich.table import Table
+    from rich.text import Text
+
     changes_table = Table(title="Resource Changes")
     changes_table.add_column("Action", style="white", no_wrap=True)
     changes_table.add_column("Addresses", style="white")
 
-    for action in sorted(summary.keys()):
+    for action in order_actions(summary):
         if action == "no-op" or not summary[action]:
             continue
 
-        action_str = action
-        sorted_addresses = sorted(summary[action])
-        addresses_str = "\n".join(sorted_addresses)
-
-        if color:
-            action_color = COLOR_MAP.get(action, COLOR_MAP["default"])
-            action_str = f"[{action_color}]{action}[/{action_color}]"
-            addresses_str = "\n".join(f"[{action_color}]{addr}[/{action_color}]" for addr in sorted_addresses)
+        # Build styled Text directly, so rich never has to parse markup in (possibly thousands of) addresses
+        style = COLOR_MAP.get(action, COLOR_MAP["default"]) if color else ""
+        action_text = Text(action, style=style)
+        addresses_text = Text("\n".join(sorted(summary[action])), style=style)
 
-        changes_table.add_row(action_str, addresses_str)
+        changes_table.add_row(action_text, addresses_text)
     return changes_table
 
 
 def run() -> None:
     """Main execution function for the script."""
     args = parse_args()
-    json_data = validate_file(args.path)
-
-    resource_changes = cast(list[dict[str, Any]], json_data.get("resource_changes", []))
-
-    action_summary = build_summary(resource_changes)
-    console = Console()
 
     show_all = not (args.statistics or args.resources)
     show_stats = args.statistics or show_all
     show_resources = args.resources or show_all
 
+    # rich is only imported once the plan has loaded, so invalid files exit without paying for it
+    if not show_resources:
+        # Only the statistics table is shown, so counts are enough (the cache still stores the full summary)
+        action_counts = load_counts(args.path, use_cache=not args.no_cache)
+        from rich.console import Console
+
+        Console().print(build_statistics_table(action_counts, color=args.color))
+        return
+
+    # The changes table never lists no-op resources, so without the cache only keep them if their count is shown
+    skip_actions = () if show_stats else ("no-op",)
+    action_summary = load_summary(args.path, use_cache=not args.no_cache, skip_actions=skip_actions)
+    from rich.console import Console
+
+    console = Console()
+
     if show_stats:
         stats_table = build_statistics_table(action_summary, color=args.color)
         console.print(stats_table)
 
-    if show_resources:
-        changes_table = build_changes_table(action_summary, color=args.color)
-        if changes_table.row_count > 0:
-            if show_stats:  # Add a blank line between tables if both are shown
-                console.print()
-            console.print(changes_table)
-        elif not show_stats:  # Only show "No changes" if resources was the only table requested
-            console.print("[green]No changes.[/green] Your infrastructure matches the configuration.")
+    # Skip building the changes table entirely for plans without any changes
+    if any(action != "no-op" for action in action_summary):
+        if show_stats:  # Add a blank line between tables if both are shown
+            console.print()
+        console.print(build_changes_table(action_summary, color=args.color))
+    elif not show_stats:  # Only show "No changes" if resources was the only table requested
+        console.print("[green]No changes.[/green] Your infrastructure matches the configuration.")
 
 
 if __name__ == "__main__":
@@ -1,17 +1,28 @@
 import json
+import os
+import subprocess
 import sys
+from collections import Counter
 from pathlib import Path
 
 import pytest
 from pytest import MonkeyPatch
 from rich.table import Table
+from rich.text import Text
 
+from tfplan_summary import main
 from tfplan_summary.main import (
     build_changes_table,
     build_statistics_table,
     build_summary,
+    check_json_extension,
     get_effective_action,
+    iter_resource_changes,
+    load_counts,
+    load_summary,
+    order_actions,
     parse_args,
+    summarize_counts,
     validate_file,
 )
 
@@ -36,6 +47,36 @@ def test_parse_args_flags(monkeypatch: MonkeyPatch):
     assert args.resources
 
 
+def test_import_does_not_load_rich():
+    """Ensures rich is not imported at module load, keeping `--help` and early errors fast."""
+    code = "import sys, tfplan_summary.main; sys.exit('rich' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@pytest.mark.parametrize("statistics_only", [False, True])
+def test_invalid_file_does_not_load_rich(tmp_path: Path, statistics_only: bool):
+    """Ensures the CLI exits on a missing or invalid plan file before importing rich.
+
+    Args:
+        tmp_path: The pytest fixture for creating temporary files and directories.
+        statistics_only: Whether to run with `-s`, which takes the count-only path.
+    """
+    invalid_path = tmp_path / "invalid.json"
+    invalid_path.write_text("{")
+    for file_path in (tmp_path / "missing.json", invalid_path):
+        argv = ["tfplan", "-p", str(file_path), "--no-cache"] + (["-s"] if statistics_only else [])
+        code = (
+            "import sys, tfplan_summary.main as m\n"
+            f"sys.argv = {argv!r}\n"
+            "try:\n"
+            "    m.run()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "sys.exit(2 if 'rich' in sys.modules else 0)"
+        )
+        assert subprocess.run([sys.executable, "-c", code], capture_output=True).returncode == 0
+
+
 # Add the 'Path' type hint
 def test_validate_file_valid_json(tmp_path: Path):
     """Ensures a valid JSON file is read and parsed correctly.
@@ -64,6 +105,38 @@ def test_validate_file_invalid_json(tmp_path: Path):
     assert "Invalid JSON format" in str(excinfo.value)
 
 
+def test_validate_file_stdlib_fallback(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Ensures files are still parsed with the stdlib when orjson is not installed.
+
+    Args:
+        tmp_path: The pytest fixture for creating temporary files and directories.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+    monkeypatch.setattr(main, "orjson", None)
+    file_path = tmp_path / "valid.json"
+    data = {"status": "ok", "resource_changes": []}
+    file_path.write_text(json.dumps(data))
+    assert validate_file(str(file_path)) == data
+
+    invalid_path = tmp_path / "invalid.json"
+    invalid_path.write_text("{")
+    with pytest.raises(SystemExit) as excinfo:
+        validate_file(str(invalid_path))
+    assert "Invalid JSON format" in str(excinfo.value)
+
+
+def test_check_json_extension():
+    """Verifies that only paths with a `.json` extension are accepted by the loaders."""
+    check_json_extension("plan.JSON")
+    with pytest.raises(SystemExit) as excinfo:
+        check_json_extension("plan.txt")
+    assert "is not a JSON file" in str(excinfo.value)
+    with pytest.raises(SystemExit):
+        list(iter_resource_changes("plan.txt"))
+    with pytest.raises(SystemExit):
+        validate_file("plan.txt")
+
+
 def test_validate_file_not_found():
     """Verifies that a non-existent file path raises SystemExit."""
     non_existent_path = "no_such_file_here.json"
@@ -73,6 +146,52 @@ def test_validate_file_not_found():
     assert non_existent_path in str(excinfo.value)
 
 
+def test_iter_resource_changes(tmp_path: Path):
+    """Ensures only the resource changes are streamed from a plan file.
+
+    Args:
+        tmp_path: The pytest fixture for creating temporary files and directories.
+    """
+    resource_changes = [
+        {"address": "resource.a", "change": {"actions": ["create"]}},
+        {"address": "resource.b", "change": {"actions": ["delete"]}},
+    ]
+    file_path = tmp_path / "plan.json"
+    file_path.write_text(json.dumps({"planned_values": {}, "resource_changes": resource_changes}))
+    assert list(iter_resource_changes(str(file_path))) == resource_changes
+
+    no_changes_path = tmp_path / "no_changes.json"
+    no_changes_path.write_text(json.dumps({"status": "ok"}))
+    assert list(iter_resource_changes(str(no_changes_path))) == []
+
+
+def test_iter_resource_changes_invalid_json(tmp_path: Path):
+    """Verifies that streaming a file with invalid JSON content raises SystemExit.
+
+    Args:
+        tmp_path: The pytest fixture for creating temporary files and directories.
+    """
+    file_path = tmp_path / "invalid.json"
+    file_path.write_text('{"resource_changes": [')
+    with pytest.raises(SystemExit) as excinfo:
+        list(iter_resource_changes(str(file_path)))
+    assert "Invalid JSON format" in str(excinfo.value)
+
+
+def test_iter_resource_changes_without_ijson(tmp_path: Path, monkeypatch: MonkeyPatch):
+    """Ensures resource changes are still loaded when ijson is not installed.
+
+    Args:
+        tmp_path: The pytest fixture for creating temporary files and directories.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+    monkeypatch.setattr(main, "ijson", None)
+    resource_changes = [{"address": "resource.a", "change": {"actions": ["create"]}}]
+    file_path = tmp_path / "plan.json"
+    file_path.write_text(json.dumps({"resource_changes": resource_changes}))
+    assert list(iter_resource_changes(str(file_path))) == resource_changes
+
+
 def test_get_effective_action():
     """Checks that the correct effective action is derived from a list of actions."""
     test_cases = [
@@ -82,7 +201,9 @@ def test_get_effective_action():
         (["delete", "create"], "replace"),
         (["create", "delete"], "replace"),
         (["no-op"], "no-op"),
+        (["update", "no-op"], "update"),
         (["read"], "read"),
+        (["read", "create"], "create"),
         ([], "unknown"),
         (["invalid-action"], "invalid-action"),
     ]
@@ -98,6 +219,8 @@ def test_build_summary():
         {"address": "resource.c", "change": {"actions": ["create", "delete"]}},
         {"address": "resource.d", "change": {"actions": ["update"]}},
         {"address": "resource.e"},
+        {"address": "resource.f", "change": None},
+        {"address": "resource.g", "change": {"actions": ["read"]}},
     ]
 
     expected_summary = {
@@ -105,7 +228,8 @@ def test_build_summary():
         "delete": ["resource.b"],
         "replace": ["resource.c"],
         "update": ["resource.d"],
-        "unknown": ["resource.e"],
+        "unknown": ["resource.e", "resource.f"],
+        "read": ["resource.g"],
     }
 
     summary = build_summary(resource_changes)
@@ -118,6 +242,243 @@ def test_build_summary():
     assert summary == expected_summary
 
 
+def test_build_summary_skip_actions():
+    """Ensures resources with a skipped effective action are left out of the summary."""
+    resource_changes = [
+        {"address": "resource.a", "change": {"actions": ["create"]}},
+        {"address": "resource.b", "change": {"actions": ["no-op"]}},
+    ]
+    assert build_summary(resource_changes, skip_actions=("no-op",)) == {"create": ["resource.a"]}
+
+
+def test_summarize_counts():
+    """Ensures resources are counted per effective action."""
+    resource_changes = [
+        {"address": "resource.a", "change": {"actions": ["create"]}},
+        {"address": "resource.b", "change": {"actions": ["create"]}},
+        {"address": "resource.c", "change": {"actions": ["delete", "create"]}},
+        {"address": "resource.d"},
+    ]
+    assert summarize_counts(resource_changes) == Counter({"create": 2, "replace": 1, "unknown": 1})
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """Points the summary cache at a temporary directory.
+
+    Args:
+        tmp_path: The pytest fixture for creating temporary files and directories.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+
+    Returns:
+        The directory the cache entries are written to.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "tfplan-summary"
+
+
+@pytest.fixture
+def plan_file(tmp_path: Path, cache_dir: Path) -> Path:
+    """Writes a plan with a single created resource, with the cache in a temporary directory.
+
+    Args:
+        tmp_path: The pytest fixture for creating temporary files and directories.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+
+    Returns:
+        The path to the plan file.
+    """
+    file_path = tmp_path / "plan.json"
+    file_path.write_text(
+        json.dumps({"resource_changes": [{"address": "resource.a", "change": {"actions": ["create"]}}]})
+    )
+    return file_path
+
+
+def test_load_summary_cache(plan_file: Path, cache_dir: Path, monkeypatch: MonkeyPatch):
+    """Ensures a summary is cached and reused while the plan file is unchanged.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+    expected_summary = {"create": ["resource.a"]}
+    assert load_summary(str(plan_file)) == expected_summary
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    # A cache hit must not parse the plan again
+    def fail(*args: object) -> None:
+        pytest.fail("build_summary was called on a cache hit")
+
+    monkeypatch.setattr(main, "build_summary", fail)
+    assert load_summary(str(plan_file)) == expected_summary
+
+
+@pytest.mark.parametrize("cached_content", ["[]", '{"create": 1}', '{"create": [1]}', '{"create": ["resource'])
+def test_load_summary_malformed_cache(plan_file: Path, cached_content: str):
+    """Verifies that a malformed cache file is treated as a cache miss instead of being returned.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cached_content: The content planted in the cache file.
+    """
+    cache_path = main.get_cache_path(str(plan_file))
+    assert cache_path is not None
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(cached_content)
+
+    assert load_counts(str(plan_file)) == Counter({"create": 1})
+    assert load_summary(str(plan_file)) == {"create": ["resource.a"]}
+
+
+def test_load_summary_failed_cache_write(plan_file: Path, cache_dir: Path, monkeypatch: MonkeyPatch):
+    """Ensures a failed cache write does not leave a temporary file behind.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+
+    def fail_replace(*args: object) -> None:
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(main.os, "replace", fail_replace)
+    assert load_summary(str(plan_file)) == {"create": ["resource.a"]}
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_load_summary_prunes_old_cache_entries(plan_file: Path, cache_dir: Path):
+    """Ensures writing a cache entry removes entries older than the maximum cache age.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+    """
+    cache_dir.mkdir(parents=True)
+    stale_entry = cache_dir / "0123456789abcdef.json"
+    stale_entry.write_text("{}")
+    stale_time = stale_entry.stat().st_mtime - main.CACHE_MAX_AGE_SECONDS - 1
+    os.utime(stale_entry, (stale_time, stale_time))
+
+    load_summary(str(plan_file))
+
+    assert not stale_entry.exists()
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+def test_load_summary_without_home_directory(plan_file: Path, monkeypatch: MonkeyPatch):
+    """Ensures the cache is skipped instead of crashing when no home directory can be determined.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+    monkeypatch.delenv("XDG_CACHE_HOME")
+
+    def no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(Path, "home", no_home)
+
+    assert main.get_cache_path(str(plan_file)) is None
+    assert load_summary(str(plan_file)) == {"create": ["resource.a"]}
+    assert load_counts(str(plan_file)) == Counter({"create": 1})
+
+
+def test_load_counts_uses_cache(plan_file: Path, monkeypatch: MonkeyPatch):
+    """Ensures counts are derived from a cached summary without parsing the plan again.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+    load_summary(str(plan_file))
+
+    def fail(*args: object) -> None:
+        pytest.fail("summarize_counts was called on a cache hit")
+
+    monkeypatch.setattr(main, "summarize_counts", fail)
+    assert load_counts(str(plan_file)) == Counter({"create": 1})
+
+
+def test_load_counts_writes_cache(plan_file: Path, cache_dir: Path, monkeypatch: MonkeyPatch):
+    """Ensures repeated statistics-only runs hit the cache on the second run.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+    assert load_counts(str(plan_file)) == Counter({"create": 1})
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def fail(*args: object) -> None:
+        pytest.fail("the plan was parsed again on a cache hit")
+
+    monkeypatch.setattr(main, "build_summary", fail)
+    monkeypatch.setattr(main, "summarize_counts", fail)
+    assert load_counts(str(plan_file)) == Counter({"create": 1})
+
+
+def test_load_counts_no_cache(plan_file: Path, cache_dir: Path):
+    """Verifies that counting without the cache neither reads nor writes cache files.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+    """
+    assert load_counts(str(plan_file), use_cache=False) == Counter({"create": 1})
+    assert not cache_dir.exists()
+
+
+def test_load_summary_skip_actions_with_cache(plan_file: Path, cache_dir: Path, monkeypatch: MonkeyPatch):
+    """Ensures skipped actions are still cached in full, so repeated runs hit the cache.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+        monkeypatch: The pytest fixture for modifying or patching modules.
+    """
+    assert load_summary(str(plan_file), skip_actions=("create",)) == {"create": ["resource.a"]}
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def fail(*args: object) -> None:
+        pytest.fail("build_summary was called on a cache hit")
+
+    monkeypatch.setattr(main, "build_summary", fail)
+    assert load_summary(str(plan_file), skip_actions=("create",)) == {"create": ["resource.a"]}
+
+
+def test_load_summary_skip_actions_without_cache(plan_file: Path, cache_dir: Path):
+    """Verifies that skipped actions are left out when the cache is off.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+    """
+    assert load_summary(str(plan_file), use_cache=False, skip_actions=("create",)) == {}
+    assert not cache_dir.exists()
+
+
+def test_load_summary_no_cache(plan_file: Path, cache_dir: Path):
+    """Verifies that disabling the cache neither reads nor writes cache files.
+
+    Args:
+        plan_file: The fixture writing a plan with a single created resource.
+        cache_dir: The fixture pointing the summary cache at a temporary directory.
+    """
+    assert load_summary(str(plan_file), use_cache=False) == {"create": ["resource.a"]}
+    assert not cache_dir.exists()
+
+
+def test_order_actions():
+    """Checks that known actions keep their fixed order and other actions follow alphabetically."""
+    actions = ["update", "unknown", "read", "create", "forget", "no-op"]
+    assert order_actions(actions) == ["create", "no-op", "unknown", "update", "forget", "read"]
+
+
 def test_build_statistics_table_runs():
     """Verifies the statistics table builds without errors for valid data."""
     summary = {"create": ["resource.a"], "delete": ["resource.b", "resource.c"]}
@@ -128,6 +489,13 @@ def test_build_statistics_table_runs():
         pytest.fail(f"build_statistics_table raised an exception: {e}")
 
 
+def test_build_statistics_table_counts():
+    """Verifies the statistics table accepts per-action counts as well as address lists."""
+    table = build_statistics_table(Counter({"create": 1, "delete": 2}), color=True)
+    assert isinstance(table, Table)
+    assert table.row_count == 3
+
+
 def test_build_changes_table_runs():
     """Verifies the resource changes table builds without errors for valid data."""
     summary = {"create": ["resource.a"], "delete": ["resource.b", "resource.c"]}
@@ -136,3 +504,14 @@ def test_build_changes_table_runs():
         assert isinstance(table, Table)
     except Exception as e:
         pytest.fail(f"build_changes_table raised an exception: {e}")
+
+
+def test_build_changes_table_colored_addresses():
+    """Checks that every address in a colored changes table is wrapped in its action color."""
+    summary = {"create": ["resource.b", "resource.a"], "no-op": ["resource.c"]}
+    table = build_changes_table(summary, color=True)
+    assert table.row_count == 1
+    address_cell = list(table.columns[1].cells)[0]
+    assert isinstance(address_cell, Text)
+    assert address_cell.plain == "resource.a\nresource.b"
+    assert address_cell.style == "green3"